@@ -9,7 +9,7 @@ All functions used for parsing input models are listed here.
 Some code here have been copied from https://github.com/onnx/sklearn-onnx/.
 """
 from collections import OrderedDict
-from copy import deepcopy
+from copy import copy, deepcopy
 import pprint
 from uuid import uuid4
 
@@ -26,7 +26,7 @@ from sklearn.preprocessing import OneHotEncoder
 from .containers import CommonSklearnModelContainer, CommonONNXModelContainer, CommonSparkMLModelContainer
 from ._topology import Topology
 from ._utils import sklearn_installed, sparkml_installed
-from .operator_converters import constants
+from .operator_converters import constants, _mutated_attrs
 from .supported import get_sklearn_api_operator_name, get_onnxml_api_operator_name, get_sparkml_api_operator_name
 
 # Stacking is only supported starting from scikit-learn 0.22.
@@ -250,6 +250,17 @@ def _parse_sklearn_single_model(topology, model, inputs):
         raise RuntimeError("Parameter model must be an object not a " "string '{0}'.".format(model))
 
     alias = get_sklearn_api_operator_name(type(model))
+
+    # Some converters write attributes on the raw model during conversion (see `_mutated_attrs`).
+    # For those models we shallow-copy the estimator (and the attributes getting written) so that
+    # the input model is left untouched without paying for a full deepcopy.
+    if alias in _mutated_attrs:
+        model = copy(model)
+        for attr in _mutated_attrs[alias]:
+            if attr in model.__dict__:
+                value = model.__dict__[attr]
+                model.__dict__[attr] = np.array(value, copy=True) if isinstance(value, np.ndarray) else copy(value)
+
     this_operator = topology.declare_logical_operator(alias, model)
     this_operator.inputs = inputs
 
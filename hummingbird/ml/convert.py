@@ -7,7 +7,11 @@
 """
 Hummingbird main (converters) API.
 """
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+import functools
+import os
+
 import psutil
 import numpy as np
 
@@ -27,32 +31,98 @@ from ._utils import (
 from .exceptions import MissingConverter, MissingBackend
 from .supported import backends
 
+# Backends are identified by their module name throughout Hummingbird. We resolve the names of
+# the optional ones once at import instead of re-importing the modules on every convert() call.
+try:
+    import torch
+
+    _TORCH_NAME = torch.__name__
+    _TORCH_JIT_NAME = torch.jit.__name__
+except ImportError:
+    _TORCH_NAME = None
+    _TORCH_JIT_NAME = None
+
+try:
+    import onnx
+
+    _ONNX_NAME = onnx.__name__
+    _ONNX_MODEL_PROTO = onnx.ModelProto
+except ImportError:
+    _ONNX_NAME = None
+    _ONNX_MODEL_PROTO = None
+
+if tvm_installed():
+    import tvm
+
+    _TVM_NAME = tvm.__name__
+else:
+    _TVM_NAME = None
+
 # Invoke the registration of all our converters.
 from . import operator_converters  # noqa
 
 # Set up the converter dispatcher.
-from .supported import xgb_operator_list  # noqa
-from .supported import lgbm_operator_list  # noqa
+from .supported import xgb_operator_set  # noqa
+from .supported import lgbm_operator_set  # noqa
+
+# The extra_config keys whose values get mutated in place during conversion.
+# All other values are kept by reference when we copy extra_config: converters must not
+# write into them, but copy locally instead.
+_MUTATED_EXTRA_CONFIG_KEYS = frozenset({constants.ONNX_INITIALIZERS})
+
+# Backend normalization happens on every convert() call: precompute the common casings of the
+# registered backend names so that the hot path can skip the str.lower() allocation.
+# Unknown spellings fall back to the lower-cased lookup.
+_BACKEND_ALIASES = {alias: backends[name] for name in list(backends) for alias in (name, name.upper(), name.capitalize())}
+
+# The number of physical cores is stable for the process lifetime: compute it once instead of
+# walking the cpu topology on every convert() call. psutil can fail in constrained environments
+# (e.g., some containers), in which case we fall back to the logical core count.
+try:
+    _PHYSICAL_CORES = psutil.cpu_count(logical=False) or os.cpu_count()
+except Exception:
+    _PHYSICAL_CORES = os.cpu_count()
+
+
+def _is_onnx_type(model_type):
+    """
+    Function returning whether the input type is an ONNX model type or not.
+    """
+    return _ONNX_MODEL_PROTO is not None and issubclass(model_type, _ONNX_MODEL_PROTO)
 
 
 def _is_onnx_model(model):
     """
     Function returning whether the input model is an ONNX model or not.
     """
-    return type(model).__name__ == "ModelProto"
+    return _is_onnx_type(type(model))
 
 
-def _is_sparkml_model(model):
+# The Spark-ML base types used by _is_sparkml_model, resolved lazily on first use so that
+# the pyspark.ml import happens at most once.
+_SPARK_TYPES = None
+
+
+def _is_sparkml_type(model_type):
     """
-    Function returning whether the input model is a Spark-ML model or not.
+    Function returning whether the input type is a Spark-ML model type or not.
     """
-    if sparkml_installed():
+    global _SPARK_TYPES
+    if _SPARK_TYPES is None:
+        if not sparkml_installed():
+            return False
         from pyspark.ml import Model, Transformer
         from pyspark.ml.pipeline import PipelineModel
 
-        return isinstance(model, Model) or isinstance(model, PipelineModel) or isinstance(model, Transformer)
-    else:
-        return False
+        _SPARK_TYPES = (Model, PipelineModel, Transformer)
+    return issubclass(model_type, _SPARK_TYPES)
+
+
+def _is_sparkml_model(model):
+    """
+    Function returning whether the input model is a Spark-ML model or not.
+    """
+    return _is_sparkml_type(type(model))
 
 
 def _supported_backend_check(backend_formatted, backend_original):
@@ -66,22 +136,17 @@ def _supported_backend_check(backend_formatted, backend_original):
 def _supported_backend_check_config(model, backend, extra_config):
     """
     Function used to check whether the specified backend and configuration pair is supported or not.
+    Only the checks relevant to the chosen backend are run.
     """
     assert_torch_installed()
-    import onnx
-    import torch
 
-    tvm_backend = None
-    if tvm_installed():
-        import tvm
+    check = _BACKEND_CHECKS.get(backend)
+    if check is not None:
+        check(model, extra_config)
 
-        tvm_backend = tvm.__name__
 
-    if (
-        (backend == torch.jit.__name__ and not _is_onnx_model(model))
-        or backend == tvm_backend
-        or (backend == onnx.__name__ and not _is_onnx_model(model) or _is_onnx_model(model) and backend == torch.__name__)
-    ) and constants.TEST_INPUT not in extra_config:
+def _require_test_input(backend, extra_config):
+    if constants.TEST_INPUT not in extra_config:
         raise RuntimeError(
             "Backend {} requires test inputs. \
             Please pass some test input to the convert function.".format(
@@ -90,6 +155,52 @@ def _supported_backend_check_config(model, backend, extra_config):
         )
 
 
+def _check_torch(model, extra_config):
+    # Going from an ONNX model to torch requires tracing inputs.
+    if _is_onnx_model(model):
+        _require_test_input(_TORCH_NAME, extra_config)
+
+
+def _check_torch_jit(model, extra_config):
+    if not _is_onnx_model(model):
+        _require_test_input(_TORCH_JIT_NAME, extra_config)
+
+    # Pick the torch.jit compilation method upfront so that the topology converter does not
+    # have to fall back from one method to the other. Only tracing is available: the Executor
+    # forward signature (variadic inputs plus numpy handling) cannot be scripted.
+    extra_config.setdefault(constants.JIT_METHOD, "trace")
+    if extra_config[constants.JIT_METHOD] != "trace":
+        raise ValueError(
+            "torch.jit method {} not supported. Only 'trace' is currently available.".format(
+                extra_config[constants.JIT_METHOD]
+            )
+        )
+
+
+def _check_onnx(model, extra_config):
+    # ONNX models come with their own input schema, everything else needs tracing inputs.
+    if not _is_onnx_model(model):
+        _require_test_input(_ONNX_NAME, extra_config)
+
+
+def _check_tvm(model, extra_config):
+    _require_test_input(_TVM_NAME, extra_config)
+
+
+# Per-backend configuration checks run by _supported_backend_check_config.
+# Backends whose library is not installed are left out (their name resolves to None).
+_BACKEND_CHECKS = {
+    name: check
+    for name, check in (
+        (_TORCH_NAME, _check_torch),
+        (_TORCH_JIT_NAME, _check_torch_jit),
+        (_ONNX_NAME, _check_onnx),
+        (_TVM_NAME, _check_tvm),
+    )
+    if name is not None
+}
+
+
 def _convert_sklearn(model, backend, test_input, device, extra_config={}):
     """
     This function converts the specified *scikit-learn* (API) model into its *backend* counterpart.
@@ -99,8 +210,10 @@ def _convert_sklearn(model, backend, test_input, device, extra_config={}):
     assert_torch_installed()
 
     # Parse scikit-learn model as our internal data structure (i.e., Topology)
-    # We modify the scikit learn model during translation.
-    model = deepcopy(model)
+    # Converters that modify the scikit-learn model during translation are registered in
+    # `operator_converters._mutated_attrs`, and the parser copies the affected attributes.
+    # This way we avoid a deepcopy of the whole input model, which for large fitted models
+    # can dominate the conversion time.
     topology = parse_sklearn_api_model(model, extra_config)
 
     # Convert the Topology object into a PyTorch model.
@@ -226,16 +339,20 @@ def _convert_onnxml(model, backend, test_input, device, extra_config={}):
 
         # Generate some random input data if necessary for the model conversion.
         if backend == onnx.__name__ or backend == tvm_backend or backend == torch.jit.__name__:
+            # Generate the random data directly in the target dtype (with a fixed seed so traces
+            # are reproducible). Drawing float64 samples and casting afterwards would allocate
+            # and scan an intermediate buffer per input.
+            rng = np.random.default_rng(0)
             test_input = []
             for i, it in enumerate(initial_types):
                 if type(it[1]) is FloatTensorType:
-                    test_input.append(np.array(np.random.rand(first_shape[0], first_shape[1]), dtype=np.float32))
+                    test_input.append(rng.random(first_shape, dtype=np.float32))
                 elif type(it[1]) is DoubleTensorType:
-                    test_input.append(np.random.rand(first_shape[0], first_shape[1]))
+                    test_input.append(rng.random(first_shape, dtype=np.float64))
                 elif type(it[1]) is Int32TensorType:
-                    test_input.append(np.array(np.random.randint(100, size=first_shape), dtype=np.int32))
+                    test_input.append(rng.integers(100, size=first_shape, dtype=np.int32))
                 elif type(it[1]) is Int64TensorType:
-                    test_input.append(np.random.randint(100, size=first_shape))
+                    test_input.append(rng.integers(100, size=first_shape, dtype=np.int64))
                 else:
                     raise RuntimeError(
                         "Type {} not supported. Please fill an issue on https://github.com/microsoft/hummingbird/.".format(
@@ -256,7 +373,13 @@ def _convert_onnxml(model, backend, test_input, device, extra_config={}):
             extra_config[constants.N_FEATURES] = test_input.shape[1]
 
     # Set the initializers. Some converter requires the access to initializers.
-    initializers = {} if model.graph.initializer is None else {in_.name: in_ for in_ in model.graph.initializer}
+    inits = model.graph.initializer
+    if inits is None or len(inits) == 0:
+        initializers = {}
+    else:
+        # Build the dict in a single constructor call: for models with thousands of weight
+        # tensors this skips one Python-level __setitem__ per initializer.
+        initializers = dict(zip((in_.name for in_ in inits), inits))
     extra_config[constants.ONNX_INITIALIZERS] = initializers
 
     # Force constants.TREE_IMPLEMENTATION="tree_trav" as onnxml has a bug with "gemm".
@@ -279,8 +402,9 @@ def _convert_sparkml(model, backend, test_input, device, extra_config={}):
     assert_torch_installed()
 
     # Parse Spark-ML model as our internal data structure (i.e., Topology)
-    # We modify the Spark-ML model during translation.
-    model = model.copy()
+    # The Spark-ML converters never modify the input model, so no upfront copy is needed.
+    # Note that the `_mutated_attrs` copy-on-write machinery only covers the sklearn parse
+    # path: a Spark-ML converter that needs to write on the model must copy locally.
     topology = parse_sparkml_api_model(model, extra_config)
 
     # Convert the Topology object into a PyTorch model.
@@ -288,14 +412,47 @@ def _convert_sparkml(model, backend, test_input, device, extra_config={}):
     return hb_model
 
 
+@functools.lru_cache(maxsize=64)
+def _specialize_convert(model_type, backend):
+    """
+    Partially evaluates convert() for a (model type, backend) pair: normalizes the backend name,
+    verifies it is supported, and picks the matching converter. The result is cached, so services
+    repeatedly converting models of the same class pay for normalization and dispatch only once.
+    """
+    backend_formatted = _BACKEND_ALIASES.get(backend)
+    if backend_formatted is None:
+        backend_formatted = backends[backend.lower()]
+
+    # Check whether we actually support the backend.
+    _supported_backend_check(backend_formatted, backend)
+
+    if model_type in xgb_operator_set:
+        converter = _convert_xgboost
+    elif model_type in lgbm_operator_set:
+        converter = _convert_lightgbm
+    elif _is_onnx_type(model_type):
+        converter = _convert_onnxml
+    elif _is_sparkml_type(model_type):
+        converter = _convert_sparkml
+    else:
+        converter = _convert_sklearn
+    return converter, backend_formatted
+
+
 def _convert_common(model, backend, test_input=None, device="cpu", extra_config={}):
     """
     A common function called by convert(...) and convert_batch(...) below.
     """
     assert model is not None
 
-    # We destroy extra_config during conversion, we create a copy here.
-    extra_config = deepcopy(extra_config)
+    # We write into extra_config during conversion: we create a shallow copy here so that the
+    # keys we add do not leak into the user dictionary. A deepcopy would also duplicate possibly
+    # large values (e.g., TEST_INPUT arrays) that are never mutated, so we deepcopy only the few
+    # keys whose values we write in place.
+    extra_config = dict(extra_config)
+    for key in _MUTATED_EXTRA_CONFIG_KEYS:
+        if key in extra_config:
+            extra_config[key] = deepcopy(extra_config[key])
 
     # Set some default configurations.
     # Add test input as extra configuration for conversion.
@@ -309,8 +466,7 @@ def _convert_common(model, backend, test_input=None, device="cpu", extra_config=
     if constants.CONTAINER not in extra_config:
         extra_config[constants.CONTAINER] = True
     # By default we set num of intra-op parallelism to be the number of physical cores available
-    if constants.N_THREADS not in extra_config:
-        extra_config[constants.N_THREADS] = psutil.cpu_count(logical=False)
+    extra_config.setdefault(constants.N_THREADS, _PHYSICAL_CORES)
 
     # Fix the test_input type
     if constants.TEST_INPUT in extra_config:
@@ -318,19 +474,36 @@ def _convert_common(model, backend, test_input=None, device="cpu", extra_config=
             extra_config[constants.TEST_INPUT] = np.array(extra_config[constants.TEST_INPUT])
         elif type(extra_config[constants.TEST_INPUT]) == tuple:
             # We are passing multiple datasets.
-            assert all(
-                [type(input) == np.ndarray for input in extra_config[constants.TEST_INPUT]]
-            ), "When passing multiple inputs only ndarrays are supported."
-            assert all([len(input.shape) == 2 for input in extra_config[constants.TEST_INPUT]])
-            extra_config[constants.N_FEATURES] = sum([input.shape[1] for input in extra_config[constants.TEST_INPUT]])
-            extra_config[constants.N_INPUTS] = len(extra_config[constants.TEST_INPUT])
+            test_input = extra_config[constants.TEST_INPUT]
+            # Validate type and shape in a single pass, stopping at the first offending input.
+            for input in test_input:
+                assert isinstance(input, np.ndarray), "When passing multiple inputs only ndarrays are supported."
+                assert input.ndim == 2
+            # Sum the feature counts with a single vectorized reduction instead of a Python loop.
+            shapes = np.fromiter((input.shape[1] for input in test_input), dtype=np.int64, count=len(test_input))
+            extra_config[constants.N_FEATURES] = int(shapes.sum())
+            extra_config[constants.N_INPUTS] = len(test_input)
         elif pandas_installed() and is_pandas_dataframe(extra_config[constants.TEST_INPUT]):
             # We split the input dataframe into columnar ndarrays
-            extra_config[constants.N_INPUTS] = len(extra_config[constants.TEST_INPUT].columns)
+            df = extra_config[constants.TEST_INPUT]
+            extra_config[constants.N_INPUTS] = len(df.columns)
             extra_config[constants.N_FEATURES] = extra_config[constants.N_INPUTS]
-            input_names = list(extra_config[constants.TEST_INPUT].columns)
-            splits = [extra_config[constants.TEST_INPUT][input_names[idx]] for idx in range(extra_config[constants.N_INPUTS])]
-            splits = [df.to_numpy().reshape(-1, 1) for df in splits]
+            input_names = list(df.columns)
+            if df.dtypes.nunique() == 1:
+                # Uniform-dtype frames: fetch the underlying 2-D array once and split it into
+                # per-column views, without materializing a Series (and a copy) per column.
+                array = df.to_numpy(copy=False)
+                splits = [array[:, idx : idx + 1] for idx in range(extra_config[constants.N_INPUTS])]
+            else:
+                # Mixed-dtype frames: to_numpy would upcast everything to a common dtype, so we
+                # fall back to a per-column conversion preserving each column's dtype. Where
+                # available (pandas 1.3+) we read the block arrays directly, skipping the
+                # Series wrapper (and its copy) per column.
+                if hasattr(df, "_mgr") and hasattr(df._mgr, "column_arrays"):
+                    columns = df._mgr.column_arrays
+                else:
+                    columns = [df[name].to_numpy() for name in input_names]
+                splits = [np.asarray(column).reshape(-1, 1) for column in columns]
             extra_config[constants.TEST_INPUT] = tuple(splits) if len(splits) > 1 else splits[0]
             extra_config[constants.INPUT_NAMES] = input_names
         elif sparkml_installed() and is_spark_dataframe(extra_config[constants.TEST_INPUT]):
@@ -342,34 +515,42 @@ def _convert_common(model, backend, test_input=None, device="cpu", extra_config=
             extra_config[constants.N_INPUTS] = len(input_names)
             extra_config[constants.N_FEATURES] = extra_config[constants.N_INPUTS]
 
-            size = df.count()
-            row_dict = df.take(1)[0].asDict()
-            splits = []
-            for field in df.schema.fields:
-                data_col = row_dict[field.name]
+            # Tracing only needs shapes and dtypes plus a small representative batch, so we move
+            # at most TRACE_BATCH_SIZE rows locally rather than running a job over the whole
+            # dataset. Bulk columnar transfer: a single toPandas() call (Arrow-based when
+            # spark.sql.execution.arrow.pyspark.enabled is set) replaces per-row Python calls.
+            trace_batch_size = extra_config[constants.TRACE_BATCH_SIZE] if constants.TRACE_BATCH_SIZE in extra_config else 8
+            pdf = df.limit(trace_batch_size).toPandas()
+
+            def materialize_column(field):
+                column = pdf[field.name]
                 spark_dtype = type(field.dataType)
-                shape = 1
-                if spark_dtype in [DenseVector, VectorUDT]:
-                    np_dtype = np.float64
-                    shape = data_col.array.shape[0]
-                elif spark_dtype == SparseVector:
-                    np_dtype = np.float64
-                    shape = data_col.size
+                if spark_dtype in [DenseVector, SparseVector, VectorUDT]:
+                    # Vector columns are materialized as vector objects: stack them into a 2-D array.
+                    return np.stack([vector.toArray() for vector in column])
                 elif spark_dtype == ArrayType:
-                    np_dtype = np.float64
-                    shape = len(data_col)
+                    return np.array(column.tolist(), dtype=np.float64)
                 elif spark_dtype == IntegerType:
-                    np_dtype = np.int32
+                    return np.ascontiguousarray(column.values, dtype=np.int32).reshape(-1, 1)
                 elif spark_dtype == FloatType:
-                    np_dtype = np.float32
+                    return np.ascontiguousarray(column.values, dtype=np.float32).reshape(-1, 1)
                 elif spark_dtype == DoubleType:
-                    np_dtype = np.float64
+                    return np.ascontiguousarray(column.values, dtype=np.float64).reshape(-1, 1)
                 elif spark_dtype == LongType:
-                    np_dtype = np.int64
+                    return np.ascontiguousarray(column.values, dtype=np.int64).reshape(-1, 1)
                 else:
                     raise ValueError("Unrecognized data type: {}".format(spark_dtype))
 
-                splits.append(np.zeros((size, shape), np_dtype))
+            # Columns materialize independently, but only the scalar dtype conversions run in
+            # numpy C code; vector columns extract rows through pure-Python pyspark calls that
+            # hold the GIL. Threads therefore only pay off on wide schemas where enough numpy
+            # work can overlap; narrow inputs keep the plain loop and skip the pool startup cost.
+            fields = df.schema.fields
+            if len(fields) > 4:
+                with ThreadPoolExecutor(max_workers=extra_config[constants.N_THREADS]) as pool:
+                    splits = list(pool.map(materialize_column, fields))
+            else:
+                splits = [materialize_column(field) for field in fields]
 
             extra_config[constants.TEST_INPUT] = tuple(splits) if len(splits) > 1 else splits[0]
             extra_config[constants.INPUT_NAMES] = input_names
@@ -379,26 +560,15 @@ def _convert_common(model, backend, test_input=None, device="cpu", extra_config=
     # We do some normalization on backends.
     if type(backend) != str:
         raise ValueError("Backend must be a string: {}".format(backend))
-    backend_formatted = backend.lower()
-    backend_formatted = backends[backend_formatted]
 
-    # Check whether we actually support the backend.
-    _supported_backend_check(backend_formatted, backend)
-    _supported_backend_check_config(model, backend_formatted, extra_config)
-
-    if type(model) in xgb_operator_list:
-        return _convert_xgboost(model, backend_formatted, test_input, device, extra_config)
+    # Normalize the backend and pick the converter. The resolution is cached per
+    # (model type, backend) pair.
+    converter, backend_formatted = _specialize_convert(type(model), backend)
 
-    if type(model) in lgbm_operator_list:
-        return _convert_lightgbm(model, backend_formatted, test_input, device, extra_config)
-
-    if _is_onnx_model(model):
-        return _convert_onnxml(model, backend_formatted, test_input, device, extra_config)
-
-    if _is_sparkml_model(model):
-        return _convert_sparkml(model, backend_formatted, test_input, device, extra_config)
+    # Check whether the backend and configuration pair is supported.
+    _supported_backend_check_config(model, backend_formatted, extra_config)
 
-    return _convert_sklearn(model, backend_formatted, test_input, device, extra_config)
+    return converter(model, backend_formatted, test_input, device, extra_config)
 
 
 def convert(model, backend, test_input=None, device="cpu", extra_config={}):
@@ -16,6 +16,24 @@ from .._utils import _Constants
 # Add constants in scope.
 constants = _Constants(converter_constants, hummingbird_constants)
 
+# Registry of the model attributes written by each converter during conversion.
+# Converters are expected to leave the input model untouched: those listed here are the
+# exceptions, and the parser shallow-copies the listed attributes before conversion so that
+# we don't have to deepcopy the whole input model.
+_mutated_attrs = {}
+
+
+def register_mutated_attrs(operator_name, attrs):
+    """
+    Registers the attributes the converter associated with *operator_name* writes on the raw model.
+
+    Args:
+        operator_name: An operator alias as used in `register_converter` (e.g., SklearnDecisionTreeClassifier)
+        attrs: A tuple of attribute names written during conversion
+    """
+    _mutated_attrs[operator_name] = attrs
+
+
 # To register a converter for scikit-learn API operators, import associated modules here.
 from .onnx import onnx_operator  # noqa: E402
 from .onnx import array_feature_extractor as onnx_afe  # noqa: E402, F811
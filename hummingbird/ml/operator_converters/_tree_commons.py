@@ -234,8 +234,11 @@ def get_parameters_for_sklearn_common(tree_infos, extra_config):
         tree_infos: The information representing a tree (ensemble)
         Returns: The tree parameters wrapped into an instance of `operator_converters._tree_commons_TreeParameters`
     """
-    lefts = tree_infos.tree_.children_left
-    rights = tree_infos.tree_.children_right
+    # The tree_trav strategies rewrite leaf entries of lefts / rights in place
+    # (see `get_parameters_for_tree_trav_common`). These buffers belong to the user's fitted
+    # model, so hand out copies instead of views. The remaining arrays are never written.
+    lefts = tree_infos.tree_.children_left.copy()
+    rights = tree_infos.tree_.children_right.copy()
     features = tree_infos.tree_.feature
     thresholds = tree_infos.tree_.threshold
     values = tree_infos.tree_.value
@@ -11,7 +11,7 @@ Converters for scikit-learn decision-tree-based models: DecisionTree, RandomFore
 import copy
 from onnxconverter_common.registration import register_converter
 
-from .. import constants
+from .. import constants, register_mutated_attrs
 from .._tree_commons import get_parameters_for_sklearn_common, get_parameters_for_tree_trav_sklearn
 from .._tree_commons import convert_decision_ensemble_tree_common
 
@@ -129,6 +129,10 @@ def convert_sklearn_decision_tree_regressor(operator, device, extra_config):
 # Register the converters.
 register_converter("SklearnDecisionTreeClassifier", convert_sklearn_decision_tree_classifier)
 register_converter("SklearnDecisionTreeRegressor", convert_sklearn_decision_tree_regressor)
+
+# The decision tree converters write `estimators_` on the raw model to reuse the forest converters.
+register_mutated_attrs("SklearnDecisionTreeClassifier", ("estimators_",))
+register_mutated_attrs("SklearnDecisionTreeRegressor", ("estimators_",))
 register_converter("SklearnExtraTreesClassifier", convert_sklearn_random_forest_classifier)
 register_converter("SklearnExtraTreesRegressor", convert_sklearn_random_forest_regressor)
 register_converter("SklearnRandomForestClassifier", convert_sklearn_random_forest_classifier)
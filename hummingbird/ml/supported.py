@@ -488,6 +488,10 @@ onnxml_operator_list = _build_onnxml_operator_list()
 sparkml_operator_list = _build_sparkml_operator_list()
 prophet_operator_list = _build_prophet_operator_list()
 
+# Frozen-set views of the operator lists above, for O(1) membership checks on the conversion hot path.
+xgb_operator_set = frozenset(xgb_operator_list)
+lgbm_operator_set = frozenset(lgbm_operator_list)
+
 sklearn_api_operator_name_map = _build_sklearn_api_operator_name_map()
 onnxml_api_operator_name_map = _build_onnxml_api_operator_name_map()
 sparkml_api_operator_name_map = _build_sparkml_api_operator_name_map()
@@ -540,3 +544,11 @@ REMAINDER_SIZE = "remainder_size"
 
 MAX_STRING_LENGTH = "max_string_length"
 """Maximum expected length for string features. By deafult this value is set using the training information."""
+
+JIT_METHOD = "jit_method"
+"""Which torch.jit compilation method to use with the torch.jit backend. Currently only trace is supported:
+the Executor forward signature (variadic inputs plus numpy handling) cannot be scripted."""
+
+TRACE_BATCH_SIZE = "trace_batch_size"
+"""Number of rows fetched from a Spark DataFrame test input for tracing the model. 8 by default.
+Tracing only needs shapes and dtypes, so there is no need to move the whole dataset locally."""
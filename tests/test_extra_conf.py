@@ -83,6 +83,29 @@ class TestExtraConf(unittest.TestCase):
         self.assertTrue(torch.get_num_threads() == 1)
         self.assertTrue(torch.get_num_interop_threads() == 1)
 
+    # Test the jit_method extra config for the torch.jit backend.
+    def test_torch_jit_method(self):
+        warnings.filterwarnings("ignore")
+        max_depth = 10
+        num_classes = 2
+        model = GradientBoostingClassifier(n_estimators=10, max_depth=max_depth)
+        np.random.seed(0)
+        X = np.random.rand(100, 200)
+        X = np.array(X, dtype=np.float32)
+        y = np.random.randint(num_classes, size=100)
+
+        model.fit(X, y)
+
+        hb_model = hummingbird.ml.convert(model, "torch.jit", X, extra_config={constants.JIT_METHOD: "trace"})
+
+        self.assertIsNotNone(hb_model)
+        np.testing.assert_allclose(model.predict(X), hb_model.predict(X), rtol=1e-06, atol=1e-06)
+
+        # Only tracing is available: scripting the Executor is not supported.
+        self.assertRaises(
+            ValueError, hummingbird.ml.convert, model, "torch.jit", X, extra_config={constants.JIT_METHOD: "script"}
+        )
+
     # Test default number of threads onnx.
     @unittest.skipIf(
         not (onnx_ml_tools_installed() and onnx_runtime_installed()), reason="ONNXML test require ONNX, ORT and ONNXMLTOOLS"
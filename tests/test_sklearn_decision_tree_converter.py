@@ -5,7 +5,13 @@ import unittest
 import warnings
 
 import numpy as np
-from sklearn.ensemble import ExtraTreesClassifier, ExtraTreesRegressor, RandomForestClassifier, RandomForestRegressor
+from sklearn.ensemble import (
+    ExtraTreesClassifier,
+    ExtraTreesRegressor,
+    GradientBoostingClassifier,
+    RandomForestClassifier,
+    RandomForestRegressor,
+)
 from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
 from sklearn import datasets
 
@@ -743,6 +749,37 @@ class TestSklearnTreeConverter(unittest.TestCase):
                     self.assertTrue(torch_model is not None)
                     np.testing.assert_allclose(model.predict(X), torch_model.predict(X), rtol=1e-5, atol=1e-5, err_msg="{}/{}/{}/{}".format(tree_method, n_targets, tree_class, seed))
 
+    # Convert is not allowed to modify the input model (we don't deepcopy it anymore).
+    def test_tree_converter_does_not_mutate_input_model(self):
+        warnings.filterwarnings("ignore")
+        np.random.seed(0)
+        X = np.random.rand(100, 20)
+        X = np.array(X, dtype=np.float32)
+        y = np.random.randint(3, size=100)
+
+        for model in [
+            DecisionTreeClassifier(max_depth=8),
+            RandomForestClassifier(n_estimators=10, max_depth=8),
+            GradientBoostingClassifier(n_estimators=10, max_depth=8),
+        ]:
+            model.fit(X, y)
+            estimators = np.asarray(model.estimators_).flatten() if hasattr(model, "estimators_") else [model]
+            saved_trees = [
+                (tree.tree_.children_left.copy(), tree.tree_.children_right.copy(), tree.tree_.value.copy())
+                for tree in estimators
+            ]
+
+            for tree_implementation in ["gemm", "tree_trav", "perf_tree_trav"]:
+                torch_model = hummingbird.ml.convert(
+                    model, "torch", extra_config={constants.TREE_IMPLEMENTATION: tree_implementation}
+                )
+                self.assertIsNotNone(torch_model)
+
+            for tree, (lefts, rights, values) in zip(estimators, saved_trees):
+                np.testing.assert_array_equal(tree.tree_.children_left, lefts)
+                np.testing.assert_array_equal(tree.tree_.children_right, rights)
+                np.testing.assert_array_equal(tree.tree_.value, values)
+
 
 if __name__ == "__main__":
     unittest.main()
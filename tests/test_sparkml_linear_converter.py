@@ -8,7 +8,7 @@ import numpy as np
 import torch
 
 from hummingbird.ml._utils import sparkml_installed, pandas_installed
-from hummingbird.ml import convert
+from hummingbird.ml import constants, convert
 from distutils.version import LooseVersion
 
 if sparkml_installed():
@@ -57,6 +57,36 @@ class TestSparkMLLinear(unittest.TestCase):
     def test_logistic_regression_multi_class(self):
         self._test_linear(5, model_class=LogisticRegression)
 
+    # Tracing inputs are fetched from a bounded batch controlled by the TRACE_BATCH_SIZE extra config.
+    @unittest.skipIf((not sparkml_installed()) or (not pandas_installed()), reason="Spark-ML test requires pyspark and pandas")
+    def test_logistic_regression_trace_batch_size(self):
+        classes = 2
+        n_features = 10
+        n_total = 100
+        np.random.seed(0)
+        warnings.filterwarnings("ignore")
+        X = np.random.rand(n_total, n_features)
+        X = np.array(X, dtype=np.float32)
+        y = np.random.randint(classes, size=(n_total, 1))
+
+        arr = np.concatenate([y, X], axis=1).reshape(n_total, -1)
+        df = map(lambda x: (int(x[0]), Vectors.dense(x[1:])), arr)
+        df = sql.createDataFrame(df, schema=["label", "features"])
+
+        model = LogisticRegression()
+        model = model.fit(df)
+
+        # Pass the full dataframe: convert should only pull TRACE_BATCH_SIZE rows for tracing.
+        test_df = df.select("features")
+        torch_model = convert(model, "torch", test_df, extra_config={constants.TRACE_BATCH_SIZE: 4})
+        self.assertTrue(torch_model is not None)
+        np.testing.assert_allclose(
+            np.array(model.transform(df).select("probability").collect()).reshape(-1, classes),
+            torch_model.predict_proba(X),
+            rtol=1e-06,
+            atol=1e-06,
+        )
+
 
 if __name__ == "__main__":
     unittest.main()